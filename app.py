@@ -5,7 +5,46 @@ Calculates investor returns based on fund-level ownership and investor's share o
 
 import streamlit as st
 import numpy as np
-import numpy_financial as npf
+import pandas as pd
+import altair as alt
+from typing import NamedTuple, Optional
+
+# Static page text
+SIDEBAR_MD = """
+- **Fund Size:** $10M
+- **Post-Money Valuation:** $82M
+- **Fund Ownership:** ~12.2% of company
+- **Liquidation Preference:** 2x Non-Participating (on fund investment)
+- **Fund Profit Split:** 80% LP / 20% GP
+- **Management Fee:** 2% annual (of fund size)
+- **Management Carve Out:** Only applies if exit < $200M
+"""
+
+HOW_IT_WORKS_MD = """
+**Fund Level:**
+1. Fund owns (Fund Size / Post-Money) of the company
+2. At exit, Fund receives greater of 2x investment or pro-rata share
+3. Management fees deducted, then 80/20 LP/GP split on profits
+
+**Investor Level:**
+
+4. Your ownership of fund = Your Contribution / Fund Size
+5. You receive your % of all LP distributions
+"""
+
+DISCLAIMER_MD = """
+**Disclaimer**
+
+This calculator is provided for informational and illustrative purposes only and does not constitute investment, financial, legal, or tax advice. The projections and calculations presented are based on hypothetical assumptions and simplified models that may not reflect actual investment outcomes.
+
+Past performance is not indicative of future results. Actual returns may vary materially due to factors including but not limited to: market conditions, deal terms, timing of exits, tax implications, and other variables not accounted for in this model.
+
+This tool should not be relied upon as the sole basis for any investment decision. Users are strongly encouraged to consult with qualified financial, legal, and tax advisors before making any investment decisions. The creators and providers of this calculator assume no liability for any losses or damages arising from the use of this tool.
+
+By using this calculator, you acknowledge that you understand these limitations and assume all risks associated with any decisions made based on the information provided.
+"""
+
+FOOTER_CAPTION = "$10M fund | $82M post-money | Fund owns 12.19% of company | 2x non-participating liquidation preference | Management carve out applies only below $200M exit"
 
 # Page configuration
 st.set_page_config(
@@ -27,34 +66,27 @@ st.divider()
 # Sidebar for fixed assumptions
 with st.sidebar:
     st.header("Fixed Assumptions")
-    st.markdown("""
-    - **Fund Size:** $10M
-    - **Post-Money Valuation:** $82M
-    - **Fund Ownership:** ~12.2% of company
-    - **Liquidation Preference:** 2x Non-Participating (on fund investment)
-    - **Fund Profit Split:** 80% LP / 20% GP
-    - **Management Fee:** 2% annual (of fund size)
-    - **Management Carve Out:** Only applies if exit < $200M
-    """)
+    st.markdown(SIDEBAR_MD)
     
     st.divider()
     st.markdown("### How It Works")
-    st.markdown("""
-    **Fund Level:**
-    1. Fund owns (Fund Size / Post-Money) of the company
-    2. At exit, Fund receives greater of 2x investment or pro-rata share
-    3. Management fees deducted, then 80/20 LP/GP split on profits
-    
-    **Investor Level:**
-    
-    4. Your ownership of fund = Your Contribution / Fund Size
-    5. You receive your % of all LP distributions
-    """)
+    st.markdown(HOW_IT_WORKS_MD)
 
-# Constants
-FUND_SIZE = 10_000_000  # $10M fund
-POST_MONEY_VALUATION = 82_000_000  # $82M valuation
+# Constants (all dollar amounts in the app are in $M)
+FUND_SIZE = 10.0  # $10M fund
+POST_MONEY_VALUATION = 82.0  # $82M valuation
 FUND_OWNERSHIP_PCT = FUND_SIZE / POST_MONEY_VALUATION  # ~12.19%
+FUND_LIQ_PREF = 2 * FUND_SIZE  # 2x non-participating liquidation preference
+ANNUAL_MANAGEMENT_FEE = FUND_SIZE * 0.02  # 2% of fund size per year
+LP_PROFIT_SHARE = 0.80  # 80/20 LP/GP profit split
+GP_CARRY = 0.20
+CARVE_OUT_THRESHOLD = 200.0  # Carve out only applies below $200M
+
+# Sensitivity grid and MOIC threshold search settings
+EXIT_GRID = np.arange(25, 1050, 25, dtype=np.float64)  # $25M to $1B exits
+MOIC_THRESHOLDS = np.array([1.0, 1.5, 2.0, 3.0, 5.0])
+THRESHOLD_EXIT_STEP = 5.0  # Required exits are reported in $5M steps
+THRESHOLD_EXIT_CAP = 1100.0  # Exits at or beyond this are shown as ">$1B"
 
 # Main input section
 st.header("Input Parameters")
@@ -68,7 +100,7 @@ with col1:
     
     st.divider()
     
-    investor_contribution_mm = st.number_input(
+    investor_contribution = st.number_input(
         "Your Investment in Fund ($M)",
         min_value=0.01,
         max_value=10.0,
@@ -77,7 +109,6 @@ with col1:
         format="%.2f",
         help="Your contribution to the $10M fund"
     )
-    investor_contribution = investor_contribution_mm * 1_000_000
     investor_fund_pct = investor_contribution / FUND_SIZE
     
     st.markdown(f"**Your Ownership of Fund:** {investor_fund_pct*100:.2f}%")
@@ -92,7 +123,7 @@ with col1:
     )
 
 with col2:
-    sale_price_mm = st.slider(
+    sale_price = st.slider(
         "Company Sale Price ($M)",
         min_value=20,
         max_value=1000,
@@ -101,7 +132,6 @@ with col2:
         format="%dM",
         help="Total exit/sale price of the company in millions"
     )
-    sale_price = sale_price_mm * 1_000_000
     
     carve_out_pct = st.slider(
         "Management Carve Out (%)",
@@ -116,17 +146,50 @@ with col2:
 st.divider()
 
 # Calculations
-def calculate_waterfall(fund_size, investor_contribution, sale_price, carve_out_pct, holding_period, post_money_val):
-    """Calculate the full investment waterfall at fund and investor level"""
+class Waterfall(NamedTuple):
+    """Full investment waterfall at fund and investor level for a single sale price"""
+    # Company-level
+    carve_out_amount: float
+    net_proceeds: float
+    # Fund-level
+    fund_ownership_pct: float
+    fund_liq_pref: float
+    fund_pro_rata: float
+    liq_pref_applies: bool
+    fund_gross_proceeds: float
+    total_management_fees: float
+    fund_net_proceeds: float
+    fund_return_of_capital: float
+    fund_profit: float
+    total_lp_profit_share: float
+    total_gp_carry: float
+    total_lp_distributions: float
+    # Investor-level
+    investor_fund_pct: float
+    investor_return_of_capital: float
+    investor_profit_share: float
+    investor_total: float
+    investor_moic: float
+    irr: Optional[float]
+    # Tax calculations
+    investor_gain: float
+    federal_tax: float
+    state_tax: float
+    total_tax: float
+    investor_net_after_tax: float
+    investor_moic_after_tax: float
+
+def _waterfall_core(investor_contribution, sale_price, carve_out_pct, holding_period):
+    """Numeric waterfall core, returning a plain tuple in Waterfall field order (IRR is NaN when undefined)"""
     
     # Fund ownership of company
-    fund_ownership_pct = fund_size / post_money_val
+    fund_ownership_pct = FUND_OWNERSHIP_PCT
     
     # Investor ownership of fund
-    investor_fund_pct = investor_contribution / fund_size
+    investor_fund_pct = investor_contribution / FUND_SIZE
     
     # Management carve out (only applies if sale price < $200M)
-    if sale_price < 200_000_000:
+    if sale_price < CARVE_OUT_THRESHOLD:
         carve_out_amount = sale_price * (carve_out_pct / 100)
     else:
         carve_out_amount = 0
@@ -135,7 +198,7 @@ def calculate_waterfall(fund_size, investor_contribution, sale_price, carve_out_
     net_proceeds = sale_price - carve_out_amount
     
     # Fund's liquidation preference (2x fund investment)
-    fund_liq_pref = 2 * fund_size
+    fund_liq_pref = FUND_LIQ_PREF
     
     # Fund's pro-rata share
     fund_pro_rata = fund_ownership_pct * net_proceeds
@@ -148,17 +211,17 @@ def calculate_waterfall(fund_size, investor_contribution, sale_price, carve_out_
     fund_gross_proceeds = min(fund_gross_proceeds, net_proceeds)
     
     # Fund-level management fees (2% of fund size per year)
-    total_management_fees = fund_size * 0.02 * holding_period
+    total_management_fees = ANNUAL_MANAGEMENT_FEE * holding_period
     
     # Fund net proceeds after fees
     fund_net_proceeds = fund_gross_proceeds - total_management_fees
     
     # Fund-level waterfall: return capital first, then split profits
-    if fund_net_proceeds >= fund_size:
-        fund_return_of_capital = fund_size
-        fund_profit = fund_net_proceeds - fund_size
-        total_lp_profit_share = fund_profit * 0.80
-        total_gp_carry = fund_profit * 0.20
+    if fund_net_proceeds >= FUND_SIZE:
+        fund_return_of_capital = FUND_SIZE
+        fund_profit = fund_net_proceeds - FUND_SIZE
+        total_lp_profit_share = fund_profit * LP_PROFIT_SHARE
+        total_gp_carry = fund_profit * GP_CARRY
     else:
         fund_return_of_capital = max(fund_net_proceeds, 0)
         fund_profit = 0
@@ -176,13 +239,11 @@ def calculate_waterfall(fund_size, investor_contribution, sale_price, carve_out_
     # Investor MOIC and IRR
     investor_moic = investor_total / investor_contribution if investor_contribution > 0 else 0
     
-    cash_flows = [-investor_contribution] + [0] * (holding_period - 1) + [investor_total]
-    try:
-        irr = npf.irr(cash_flows)
-        if np.isnan(irr):
-            irr = None
-    except:
-        irr = None
+    # Single cash flow at exit, so IRR has a closed form
+    if investor_total > 0 and investor_contribution > 0 and holding_period > 0:
+        irr = (investor_total / investor_contribution) ** (1.0 / holding_period) - 1.0
+    else:
+        irr = np.nan
 
     # Tax calculations (only on gains)
     federal_ltcg_rate = 0.20
@@ -203,49 +264,169 @@ def calculate_waterfall(fund_size, investor_contribution, sale_price, carve_out_
     # After-tax MOIC
     investor_moic_after_tax = investor_net_after_tax / investor_contribution if investor_contribution > 0 else 0
     
-    return {
-        # Company-level
-        'carve_out_amount': carve_out_amount,
-        'net_proceeds': net_proceeds,
-        # Fund-level
-        'fund_ownership_pct': fund_ownership_pct,
-        'fund_liq_pref': fund_liq_pref,
-        'fund_pro_rata': fund_pro_rata,
-        'liq_pref_applies': liq_pref_applies,
-        'fund_gross_proceeds': fund_gross_proceeds,
-        'total_management_fees': total_management_fees,
-        'fund_net_proceeds': fund_net_proceeds,
-        'fund_return_of_capital': fund_return_of_capital,
-        'fund_profit': fund_profit,
-        'total_lp_profit_share': total_lp_profit_share,
-        'total_gp_carry': total_gp_carry,
-        'total_lp_distributions': total_lp_distributions,
-        # Investor-level
-        'investor_fund_pct': investor_fund_pct,
-        'investor_return_of_capital': investor_return_of_capital,
-        'investor_profit_share': investor_profit_share,
-        'investor_total': investor_total,
-        'investor_moic': investor_moic,
-        'irr': irr,
-        
-        # Tax calculations
-        'investor_gain': investor_gain,
-        'federal_tax': federal_tax,
-        'state_tax': state_tax,
-        'total_tax': total_tax,
-        'investor_net_after_tax': investor_net_after_tax,
-        'investor_moic_after_tax': investor_moic_after_tax
-    }
-
-# Run calculations
-results = calculate_waterfall(
-    FUND_SIZE,
-    investor_contribution, 
-    sale_price, 
-    carve_out_pct, 
-    holding_period,
-    POST_MONEY_VALUATION
-)
+    return (
+        carve_out_amount, net_proceeds,
+        fund_ownership_pct, fund_liq_pref, fund_pro_rata, liq_pref_applies,
+        fund_gross_proceeds, total_management_fees, fund_net_proceeds,
+        fund_return_of_capital, fund_profit, total_lp_profit_share,
+        total_gp_carry, total_lp_distributions,
+        investor_fund_pct, investor_return_of_capital, investor_profit_share,
+        investor_total, investor_moic, irr,
+        investor_gain, federal_tax, state_tax, total_tax,
+        investor_net_after_tax, investor_moic_after_tax,
+    )
+
+@st.cache_data(show_spinner=False, max_entries=4096)
+def calculate_waterfall(investor_contribution, sale_price, carve_out_pct, holding_period):
+    """Calculate the full investment waterfall at fund and investor level"""
+    results = Waterfall._make(_waterfall_core(investor_contribution, sale_price, carve_out_pct, holding_period))
+    if np.isnan(results.irr):
+        results = results._replace(irr=None)
+    return results
+
+class WaterfallArrays(NamedTuple):
+    """Waterfall results over a grid of sale prices, one array per field"""
+    sale_price: np.ndarray
+    net_proceeds: np.ndarray
+    fund_gross_proceeds: np.ndarray
+    fund_net_proceeds: np.ndarray
+    total_lp_distributions: np.ndarray
+    investor_total: np.ndarray
+    investor_moic: np.ndarray
+    irr: np.ndarray
+    investor_net_after_tax: np.ndarray
+    investor_moic_after_tax: np.ndarray
+
+def calculate_waterfall_vec(investor_contribution, sale_prices, carve_out_pct, holding_period):
+    """Vectorized calculate_waterfall over an array of sale prices"""
+
+    sale_prices = np.asarray(sale_prices, dtype=np.float64)
+
+    investor_fund_pct = investor_contribution / FUND_SIZE
+
+    # Management carve out (only applies if sale price < $200M)
+    carve_out_amount = np.where(sale_prices < CARVE_OUT_THRESHOLD, sale_prices * (carve_out_pct / 100), 0.0)
+    net_proceeds = sale_prices - carve_out_amount
+
+    # Fund receives greater of 2x liq pref or pro-rata, capped at net proceeds
+    fund_pro_rata = FUND_OWNERSHIP_PCT * net_proceeds
+    fund_gross_proceeds = np.minimum(np.maximum(FUND_LIQ_PREF, fund_pro_rata), net_proceeds)
+
+    total_management_fees = ANNUAL_MANAGEMENT_FEE * holding_period
+    fund_net_proceeds = fund_gross_proceeds - total_management_fees
+
+    # Fund-level waterfall: return capital first, then split profits
+    fund_return_of_capital = np.clip(fund_net_proceeds, 0, FUND_SIZE)
+    fund_profit = np.maximum(fund_net_proceeds - FUND_SIZE, 0)
+    total_lp_profit_share = fund_profit * LP_PROFIT_SHARE
+    total_lp_distributions = fund_return_of_capital + total_lp_profit_share
+
+    investor_total = investor_fund_pct * total_lp_distributions
+    investor_moic = investor_total / investor_contribution
+
+    # Single cash flow at exit, so IRR follows directly from MOIC; np.where evaluates
+    # both branches, so silence warnings from the masked-out non-positive entries
+    with np.errstate(invalid='ignore', divide='ignore'):
+        irr = np.where(investor_moic > 0, np.power(investor_moic, 1.0 / holding_period) - 1.0, np.nan)
+
+    # Taxes (25%) on gains only
+    investor_gain = np.maximum(investor_total - investor_contribution, 0)
+    total_tax = investor_gain * (0.20 + 0.05)
+    investor_net_after_tax = investor_total - total_tax
+    investor_moic_after_tax = investor_net_after_tax / investor_contribution
+
+    return WaterfallArrays(
+        sale_price=sale_prices,
+        net_proceeds=net_proceeds,
+        fund_gross_proceeds=fund_gross_proceeds,
+        fund_net_proceeds=fund_net_proceeds,
+        total_lp_distributions=total_lp_distributions,
+        investor_total=investor_total,
+        investor_moic=investor_moic,
+        irr=irr,
+        investor_net_after_tax=investor_net_after_tax,
+        investor_moic_after_tax=investor_moic_after_tax
+    )
+
+def required_exit_for_moic(target_moics, carve_out_pct, holding_period):
+    """Smallest company sale price at which the investor reaches each target pre-tax MOIC, as an array"""
+
+    target_moics = np.asarray(target_moics, dtype=np.float64)
+
+    # Total LP distributions needed for the investor's share to hit the target; the
+    # investor's share of the fund scales with their contribution, so this does not
+    # depend on how much they put in
+    needed_lp_distributions = target_moics * FUND_SIZE
+
+    # Undo the fund waterfall: capital is returned first, LPs get 80% of profits beyond it
+    fund_net_proceeds = np.where(
+        needed_lp_distributions <= FUND_SIZE,
+        needed_lp_distributions,
+        FUND_SIZE + (needed_lp_distributions - FUND_SIZE) / LP_PROFIT_SHARE
+    )
+    fund_gross_proceeds = fund_net_proceeds + ANNUAL_MANAGEMENT_FEE * holding_period
+
+    # Undo the preference: the fund takes all net proceeds up to the 2x liq pref,
+    # is flat at the liq pref until pro-rata overtakes it, then takes pro-rata
+    net_proceeds = np.where(
+        fund_gross_proceeds <= FUND_LIQ_PREF,
+        fund_gross_proceeds,
+        fund_gross_proceeds / FUND_OWNERSHIP_PCT
+    )
+
+    # Undo the carve out, which only applies below $200M; net proceeds jump to
+    # the full sale price at $200M, so anything between the two regimes lands there
+    carved_sale_price = net_proceeds / (1 - carve_out_pct / 100)
+    return np.where(carved_sale_price < CARVE_OUT_THRESHOLD, carved_sale_price, np.maximum(net_proceeds, CARVE_OUT_THRESHOLD))
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def build_sensitivity(investor_contribution, carve_out_pct, holding_period):
+    """Build the sensitivity sweep chart data, which does not depend on the selected sale price"""
+
+    # Sensitivity analysis across different exit values, as one long-form chart frame
+    sweep = calculate_waterfall_vec(investor_contribution, EXIT_GRID, carve_out_pct, holding_period)
+    sensitivity_df = pd.DataFrame({
+        "Exit Value ($M)": sweep.sale_price,
+        "Net After Tax ($M)": sweep.investor_net_after_tax,
+        "After-Tax MOIC": sweep.investor_moic_after_tax,
+        "IRR (%)": sweep.irr * 100
+    }).melt("Exit Value ($M)", var_name="Metric", value_name="Value")
+
+    return sensitivity_df
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def build_thresholds(carve_out_pct, holding_period):
+    """Build the MOIC threshold table, which depends on neither the sale price nor the contribution"""
+
+    # Find breakeven and target MOICs
+    threshold_results = []
+
+    # Report on a $5M grid, as the smallest step at or above the exact exit
+    required_exits = required_exit_for_moic(MOIC_THRESHOLDS, carve_out_pct, holding_period)
+    required_exits = np.ceil(required_exits / THRESHOLD_EXIT_STEP) * THRESHOLD_EXIT_STEP
+
+    for target_moic, exit_val in zip(MOIC_THRESHOLDS, required_exits):
+        if exit_val < THRESHOLD_EXIT_CAP:
+            threshold_results.append({
+                'Target MOIC': f"{target_moic}x",
+                'Required Exit': f"${exit_val:.0f}M",
+                'Exit Multiple': f"{exit_val/POST_MONEY_VALUATION:.1f}x"
+            })
+        else:
+            threshold_results.append({
+                'Target MOIC': f"{target_moic}x",
+                'Required Exit': ">$1B",
+                'Exit Multiple': ">12.2x"
+            })
+
+    return pd.DataFrame(threshold_results)
+
+# Run calculations, reusing this session's last results while the inputs are unchanged
+results_key = (investor_contribution, sale_price, carve_out_pct, holding_period)
+if st.session_state.get('results_key') != results_key:
+    st.session_state['results'] = calculate_waterfall(*results_key)
+    st.session_state['results_key'] = results_key
+results = st.session_state['results']
 
 # Display Results
 st.header("Results Breakdown")
@@ -257,34 +438,34 @@ col1, col2, col3, col4, col5 = st.columns(5)
 with col1:
     st.metric(
         label="Gross Return",
-        value=f"${results['investor_total']/1e6:,.2f}M",
-        delta=f"${(results['investor_total'] - investor_contribution)/1e6:,.2f}M"
+        value=f"${results.investor_total:,.2f}M",
+        delta=f"${results.investor_total - investor_contribution:,.2f}M"
     )
 
 with col2:
     st.metric(
         label="Taxes (25%)",
-        value=f"${results['total_tax']/1e6:,.2f}M"
+        value=f"${results.total_tax:,.2f}M"
     )
 
 with col3:
     st.metric(
         label="Net After Tax",
-        value=f"${results['investor_net_after_tax']/1e6:,.2f}M",
-        delta=f"${(results['investor_net_after_tax'] - investor_contribution)/1e6:,.2f}M"
+        value=f"${results.investor_net_after_tax:,.2f}M",
+        delta=f"${results.investor_net_after_tax - investor_contribution:,.2f}M"
     )
 
 with col4:
     st.metric(
         label="After-Tax MOIC",
-        value=f"{results['investor_moic_after_tax']:.2f}x"
+        value=f"{results.investor_moic_after_tax:.2f}x"
     )
 
 with col5:
-    if results['irr'] is not None:
+    if results.irr is not None:
         st.metric(
             label="Pre-Tax IRR",
-            value=f"{results['irr']*100:.1f}%"
+            value=f"{results.irr*100:.1f}%"
         )
     else:
         st.metric(
@@ -300,63 +481,79 @@ col_left, col_mid, col_right = st.columns(3)
 with col_left:
     st.subheader("Company-Level")
     
-    st.write(f"**Sale Price:** ${sale_price/1e6:,.1f}M")
-    if sale_price < 200_000_000:
-        st.write(f"Management Carve Out ({carve_out_pct:.1f}%): (${results['carve_out_amount']/1e6:,.2f}M)")
+    # One markdown element per block, with each line as its own paragraph
+    if sale_price < CARVE_OUT_THRESHOLD:
+        carve_out_line = f"Management Carve Out ({carve_out_pct:.1f}%): (${results.carve_out_amount:,.2f}M)"
     else:
-        st.write(f"Management Carve Out: $0 (N/A above $200M)")
-    st.write(f"**Net Proceeds: ${results['net_proceeds']/1e6:,.2f}M**")
+        carve_out_line = "Management Carve Out: $0 (N/A above $200M)"
+    st.markdown(
+        f"**Sale Price:** ${sale_price:,.1f}M\n\n"
+        f"{carve_out_line}\n\n"
+        f"**Net Proceeds: ${results.net_proceeds:,.2f}M**"
+    )
     
     st.divider()
     
     st.subheader("Fund's Share")
     
-    liq_pref_status = "Yes" if results['liq_pref_applies'] else "No (Pro-rata is higher)"
+    liq_pref_status = "Yes" if results.liq_pref_applies else "No (Pro-rata is higher)"
     
-    st.write(f"Fund Ownership: {results['fund_ownership_pct']*100:.2f}%")
-    st.write(f"2x Liquidation Preference: ${results['fund_liq_pref']/1e6:,.2f}M")
-    st.write(f"Pro-Rata Share: ${results['fund_pro_rata']/1e6:,.2f}M")
-    st.write(f"**Liq Pref Applies:** {liq_pref_status}")
-    st.write(f"**Fund Receives: ${results['fund_gross_proceeds']/1e6:,.2f}M**")
+    st.markdown(
+        f"Fund Ownership: {results.fund_ownership_pct*100:.2f}%\n\n"
+        f"2x Liquidation Preference: ${results.fund_liq_pref:,.2f}M\n\n"
+        f"Pro-Rata Share: ${results.fund_pro_rata:,.2f}M\n\n"
+        f"**Liq Pref Applies:** {liq_pref_status}\n\n"
+        f"**Fund Receives: ${results.fund_gross_proceeds:,.2f}M**"
+    )
 
 with col_mid:
     st.subheader("Fund-Level Waterfall")
     
-    st.write(f"Gross Proceeds: ${results['fund_gross_proceeds']/1e6:,.2f}M")
-    st.write(f"Management Fees (2% x {holding_period} yrs): (${results['total_management_fees']/1e6:,.2f}M)")
-    st.write(f"**Net Fund Proceeds: ${results['fund_net_proceeds']/1e6:,.2f}M**")
+    st.markdown(
+        f"Gross Proceeds: ${results.fund_gross_proceeds:,.2f}M\n\n"
+        f"Management Fees (2% x {holding_period} yrs): (${results.total_management_fees:,.2f}M)\n\n"
+        f"**Net Fund Proceeds: ${results.fund_net_proceeds:,.2f}M**"
+    )
     
     st.divider()
     
-    st.write(f"Return of Capital: ${results['fund_return_of_capital']/1e6:,.2f}M")
-    st.write(f"Fund Profit: ${results['fund_profit']/1e6:,.2f}M")
-    st.write(f"LP Profit Share (80%): ${results['total_lp_profit_share']/1e6:,.2f}M")
-    st.write(f"GP Carry (20%): ${results['total_gp_carry']/1e6:,.2f}M")
-    st.write(f"**Total LP Distributions: ${results['total_lp_distributions']/1e6:,.2f}M**")
+    st.markdown(
+        f"Return of Capital: ${results.fund_return_of_capital:,.2f}M\n\n"
+        f"Fund Profit: ${results.fund_profit:,.2f}M\n\n"
+        f"LP Profit Share (80%): ${results.total_lp_profit_share:,.2f}M\n\n"
+        f"GP Carry (20%): ${results.total_gp_carry:,.2f}M\n\n"
+        f"**Total LP Distributions: ${results.total_lp_distributions:,.2f}M**"
+    )
 
 with col_right:
     st.subheader("Your Share (LP)")
     
-    st.write(f"Your Fund Ownership: {results['investor_fund_pct']*100:.2f}%")
+    st.markdown(f"Your Fund Ownership: {results.investor_fund_pct*100:.2f}%")
     
     st.divider()
     
-    st.write(f"Your Return of Capital: ${results['investor_return_of_capital']/1e6:,.2f}M")
-    st.write(f"Your Profit Share: ${results['investor_profit_share']/1e6:,.2f}M")
-    st.write(f"**Gross to You: ${results['investor_total']/1e6:,.2f}M**")
+    st.markdown(
+        f"Your Return of Capital: ${results.investor_return_of_capital:,.2f}M\n\n"
+        f"Your Profit Share: ${results.investor_profit_share:,.2f}M\n\n"
+        f"**Gross to You: ${results.investor_total:,.2f}M**"
+    )
     
     st.divider()
     
-    st.write("**Tax Deductions**")
-    st.write(f"Taxable Gain: ${results['investor_gain']/1e6:,.2f}M")
-    st.write(f"Federal LTCG (20%): (${results['federal_tax']/1e6:,.2f}M)")
-    st.write(f"State Tax (5%): (${results['state_tax']/1e6:,.2f}M)")
-    st.write(f"**Total Tax: (${results['total_tax']/1e6:,.2f}M)**")
+    st.markdown(
+        "**Tax Deductions**\n\n"
+        f"Taxable Gain: ${results.investor_gain:,.2f}M\n\n"
+        f"Federal LTCG (20%): (${results.federal_tax:,.2f}M)\n\n"
+        f"State Tax (5%): (${results.state_tax:,.2f}M)\n\n"
+        f"**Total Tax: (${results.total_tax:,.2f}M)**"
+    )
     
     st.divider()
     
-    st.write(f"**Net After Tax: ${results['investor_net_after_tax']/1e6:,.2f}M**")
-    st.write(f"**After-Tax MOIC: {results['investor_moic_after_tax']:.2f}x**")
+    st.markdown(
+        f"**Net After Tax: ${results.investor_net_after_tax:,.2f}M**\n\n"
+        f"**After-Tax MOIC: {results.investor_moic_after_tax:.2f}x**"
+    )
 
 st.divider()
 
@@ -371,42 +568,27 @@ with tab1:
     # Create a text-based waterfall visualization
     waterfall_data = [
     ("Company Sale Price", sale_price, sale_price),
-    ("Management Carve Out", -results['carve_out_amount'], results['net_proceeds']),
-    ("To Other Shareholders", -(results['net_proceeds'] - results['fund_gross_proceeds']), results['fund_gross_proceeds']),
-    ("Fund Management Fees", -results['total_management_fees'], results['fund_net_proceeds']),
-    ("GP Carry", -results['total_gp_carry'], results['total_lp_distributions']),
-    ("To Other LPs", -(results['total_lp_distributions'] - results['investor_total']), results['investor_total']),
-    ("Taxes (25%)", -results['total_tax'], results['investor_net_after_tax']),
+    ("Management Carve Out", -results.carve_out_amount, results.net_proceeds),
+    ("To Other Shareholders", -(results.net_proceeds - results.fund_gross_proceeds), results.fund_gross_proceeds),
+    ("Fund Management Fees", -results.total_management_fees, results.fund_net_proceeds),
+    ("GP Carry", -results.total_gp_carry, results.total_lp_distributions),
+    ("To Other LPs", -(results.total_lp_distributions - results.investor_total), results.investor_total),
+    ("Taxes (25%)", -results.total_tax, results.investor_net_after_tax),
 ]
     
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.write("**Step**")
-    with col2:
-        st.write("**Change**")
-    with col3:
-        st.write("**Running Total**")
-    
-    for label, change, running in waterfall_data:
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.write(label)
-        with col2:
-            if change >= 0:
-                st.write(f":green[+${change/1e6:,.2f}M]")
-            else:
-                st.write(f":red[-${abs(change)/1e6:,.2f}M]")
-        with col3:
-            st.write(f"${running/1e6:,.2f}M")
+    # Render the steps as a single table, coloring gains green and deductions red
+    waterfall_df = pd.DataFrame(waterfall_data, columns=["Step", "Change ($M)", "Running Total ($M)"])
+    waterfall_df["Change ($M)"] += 0.0  # turn -0.0 into 0.0 so zero steps render as a green +0.00
+    waterfall_styler = (
+        waterfall_df.style
+        .map(lambda v: 'color: green' if v >= 0 else 'color: red', subset=["Change ($M)"])
+        .format({"Change ($M)": "{:+,.2f}", "Running Total ($M)": "{:,.2f}"})
+    )
+    st.dataframe(waterfall_styler, hide_index=True)
     
     st.divider()
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.write("**Net to You (After Tax)**")
-    with col2:
-        st.write("")
-    with col3:
-        st.write(f"**:blue[${results['investor_net_after_tax']/1e6:,.2f}M]**")        
+    st.markdown(f"**Net to You (After Tax): :blue[${results.investor_net_after_tax:,.2f}M]**")
+    
     # Bar chart representation
     st.subheader("Visual Breakdown")
     
@@ -420,116 +602,65 @@ with tab1:
         "6. Your Share"
     ]
     amounts = [
-        sale_price / 1e6,
-        results['net_proceeds'] / 1e6,
-        results['fund_gross_proceeds'] / 1e6,
-        results['fund_net_proceeds'] / 1e6,
-        results['total_lp_distributions'] / 1e6,
-        results['investor_total'] / 1e6
+        sale_price,
+        results.net_proceeds,
+        results.fund_gross_proceeds,
+        results.fund_net_proceeds,
+        results.total_lp_distributions,
+        results.investor_total
     ]
     
-    # Display as horizontal metrics for cleaner ordered view
-    for cat, amt in zip(categories, amounts):
-        col_label, col_bar = st.columns([1, 3])
-        with col_label:
-            st.write(cat)
-        with col_bar:
-            st.progress(min(amt / (sale_price / 1e6), 1.0))
-            st.caption(f"${amt:,.2f}M")
+    # Display as a horizontal bar chart, keeping the waterfall order top to bottom
+    breakdown_df = pd.DataFrame({"Stage": categories, "Amount ($M)": amounts})
+    breakdown_chart = alt.Chart(breakdown_df).mark_bar().encode(
+        y=alt.Y("Stage:N", sort=None, title=None),
+        x=alt.X("Amount ($M):Q"),
+        tooltip=["Stage", alt.Tooltip("Amount ($M):Q", format=",.2f")]
+    ).properties(height=200)
+    st.altair_chart(breakdown_chart)
     
     st.caption("Amount in millions ($M)")
 
 with tab2:
     st.subheader("Returns at Different Exit Values")
     
-    # Sensitivity analysis across different exit values
-    exit_values = list(range(25_000_000, 1_050_000_000, 25_000_000))
-    moics = []
-    irrs = []
-    net_proceeds_list = []
-    
-    for exit_val in exit_values:
-        r = calculate_waterfall(FUND_SIZE, investor_contribution, exit_val, carve_out_pct, holding_period, POST_MONEY_VALUATION)
-        moics.append(r['investor_moic_after_tax'])  # Changed from investor_moic
-        irrs.append(r['irr'] * 100 if r['irr'] is not None else 0)
-        net_proceeds_list.append(r['investor_net_after_tax'])  # Changed from investor_total        
-    # Net Proceeds Chart
-    st.write("**Your Net Proceeds (After Tax) by Exit Value**")
-    net_chart_data = {
-        "Exit Value ($M)": [v / 1e6 for v in exit_values],
-        "Net After Tax ($M)": [v / 1e6 for v in net_proceeds_list]
-    }
-    st.line_chart(net_chart_data, x="Exit Value ($M)", y="Net After Tax ($M)")
-    
-    # MOIC Chart
-    st.write("**Your After-Tax MOIC by Exit Value**")
-    moic_chart_data = {
-        "Exit Value ($M)": [v / 1e6 for v in exit_values],
-        "After-Tax MOIC": moics
-    }
-    st.line_chart(moic_chart_data, x="Exit Value ($M)", y="After-Tax MOIC")
-    
-    # IRR Chart
-    st.write("**Your IRR by Exit Value**")
-    irr_chart_data = {
-        "Exit Value ($M)": [v / 1e6 for v in exit_values],
-        "IRR (%)": irrs
-    }
-    st.line_chart(irr_chart_data, x="Exit Value ($M)", y="IRR (%)")
-    
-    # Current position indicator
-    st.info(f"**Current selection:** ${sale_price/1e6:.0f}M exit → {results['investor_moic']:.2f}x MOIC, {results['irr']*100:.1f}% IRR" if results['irr'] else f"**Current selection:** ${sale_price/1e6:.0f}M exit → {results['investor_moic']:.2f}x MOIC")
-    
-    # Table showing key thresholds
-    st.subheader("Key Return Thresholds")
-    
-    # Find breakeven and target MOICs
-    thresholds = [1.0, 1.5, 2.0, 3.0, 5.0]
-    threshold_results = []
-    
-    for target_moic in thresholds:
-        found = False
-        for exit_val in range(5_000_000, 1_100_000_000, 5_000_000):
-            r = calculate_waterfall(FUND_SIZE, investor_contribution, exit_val, carve_out_pct, holding_period, POST_MONEY_VALUATION)
-            if r['investor_moic'] >= target_moic:
-                threshold_results.append({
-                    'Target MOIC': f"{target_moic}x",
-                    'Required Exit': f"${exit_val/1e6:.0f}M",
-                    'Exit Multiple': f"{exit_val/POST_MONEY_VALUATION:.1f}x"
-                })
-                found = True
-                break
-        if not found:
-            threshold_results.append({
-                'Target MOIC': f"{target_moic}x",
-                'Required Exit': ">$1B",
-                'Exit Multiple': ">12.2x"
-            })
-    
-    # Display as columns
-    cols = st.columns(5)
-    for i, result in enumerate(threshold_results):
-        with cols[i]:
-            st.metric(
-                label=f"For {result['Target MOIC']}",
-                value=result['Required Exit'],
-                delta=result['Exit Multiple']
-            )
+    # Streamlit runs every tab body on each rerun, so only build the sweep once asked to
+    if st.checkbox("Compute sensitivity analysis", key="show_sensitivity"):
+        # Reuse this session's last sweep while its inputs are unchanged (e.g. when only the sale price moves)
+        sweep_key = (investor_contribution, carve_out_pct, holding_period)
+        if st.session_state.get('sweep_key') != sweep_key:
+            st.session_state['sweep'] = (build_sensitivity(*sweep_key), build_thresholds(carve_out_pct, holding_period))
+            st.session_state['sweep_key'] = sweep_key
+        sensitivity_df, threshold_df = st.session_state['sweep']
+
+        # One long-form dataset rendered as a single stacked chart, one panel per metric
+        sensitivity_panels = [
+            ("Net After Tax ($M)", "Your Net Proceeds (After Tax) by Exit Value"),
+            ("After-Tax MOIC", "Your After-Tax MOIC by Exit Value"),
+            ("IRR (%)", "Your IRR by Exit Value"),
+        ]
+        sensitivity_base = alt.Chart(sensitivity_df).mark_line()
+        sensitivity_chart = alt.vconcat(*[
+            sensitivity_base.transform_filter(alt.datum.Metric == metric).encode(
+                x=alt.X("Exit Value ($M):Q"),
+                y=alt.Y("Value:Q", title=metric)
+            ).properties(title=title, height=200)
+            for metric, title in sensitivity_panels
+        ])
+        st.altair_chart(sensitivity_chart)
+        
+        # Current position indicator
+        st.info(f"**Current selection:** ${sale_price:.0f}M exit → {results.investor_moic:.2f}x MOIC, {results.irr*100:.1f}% IRR" if results.irr else f"**Current selection:** ${sale_price:.0f}M exit → {results.investor_moic:.2f}x MOIC")
+        
+        # Table showing key thresholds
+        st.subheader("Key Return Thresholds")
+        
+        st.dataframe(threshold_df, hide_index=True)
 
 
 # Footer
 st.divider()
-st.caption("$10M fund | $82M post-money | Fund owns 12.19% of company | 2x non-participating liquidation preference | Management carve out applies only below $200M exit")
+st.caption(FOOTER_CAPTION)
 
 st.divider()
-st.markdown("""
-**Disclaimer**
-
-This calculator is provided for informational and illustrative purposes only and does not constitute investment, financial, legal, or tax advice. The projections and calculations presented are based on hypothetical assumptions and simplified models that may not reflect actual investment outcomes.
-
-Past performance is not indicative of future results. Actual returns may vary materially due to factors including but not limited to: market conditions, deal terms, timing of exits, tax implications, and other variables not accounted for in this model.
-
-This tool should not be relied upon as the sole basis for any investment decision. Users are strongly encouraged to consult with qualified financial, legal, and tax advisors before making any investment decisions. The creators and providers of this calculator assume no liability for any losses or damages arising from the use of this tool.
-
-By using this calculator, you acknowledge that you understand these limitations and assume all risks associated with any decisions made based on the information provided.
-""", help=None)
+st.markdown(DISCLAIMER_MD)